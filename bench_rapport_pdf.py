@@ -0,0 +1,42 @@
+# Mesure du temps de rendu d'un rapport de flotte avec rapport_pdf.PDF.add_table
+# Utilisation : python bench_rapport_pdf.py [nombre_de_lignes ...]
+import random
+import sys
+import time
+
+from rapport_pdf import FPDF_AVAILABLE, construire_rapport_pdf
+
+MAKES = ("Renault", "Peugeot", "Citroën", "Audi", "Fiat", "BMW", "Volkswagen", "Toyota", "Hyundai")
+HEADERS = ("Marque", "Modèle", "Prix HT (DZD)", "Droits (DZD)", "TIC (DZD)", "TVA (DZD)", "Total (DZD)", "Revente (DZD)", "Bénéfice (DZD)")
+
+# Fonction pour générer les colonnes d'une flotte fictive
+def colonnes_flotte(rows):
+    rng = random.Random(0)
+    prix = [rng.uniform(1_000_000, 10_000_000) for _ in range(rows)]
+    droits = [p * 0.15 for p in prix]
+    tic = [0.0] * rows
+    tva = [(p + d + 50000) * 0.19 for p, d in zip(prix, droits)]
+    total = [p + d + 50000 + v for p, d, v in zip(prix, droits, tva)]
+    revente = [t * rng.uniform(0.9, 1.3) for t in total]
+    benefice = [r - t for r, t in zip(revente, total)]
+    values = (
+        [rng.choice(MAKES) for _ in range(rows)],
+        [f"Modèle {i % 40}" for i in range(rows)],
+        prix, droits, tic, tva, total, revente, benefice,
+    )
+    return tuple((header, tuple(column)) for header, column in zip(HEADERS, values))
+
+def main(sizes):
+    if not FPDF_AVAILABLE:
+        sys.exit("Le module 'fpdf' n'est pas installé.")
+    for rows in sizes:
+        rapport = ("Rapport d'Importation de Véhicule", (
+            ("table", "Détail de la Flotte", colonnes_flotte(rows), {"row_height": 7, "font_size": 7, "text_columns": (0, 1)}),
+        ))
+        start = time.perf_counter()
+        data = construire_rapport_pdf(rapport)
+        elapsed = time.perf_counter() - start
+        print(f"{rows:>7} lignes : {elapsed:6.2f} s ({len(data) / 1024:,.0f} Ko, {elapsed / rows * 1e6:,.1f} µs/ligne)")
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1_000, 10_000])
@@ -0,0 +1,509 @@
+import sys
+import threading
+from types import MappingProxyType
+
+# Catalogues de messages source pour les différentes langues.
+# Chaque catalogue est une fonction : il n'est construit qu'au premier chargement
+# de la langue dans le processus, puis compilé par get_catalog.
+def catalogue_french():
+    return {
+        "pdf_language": "French",
+        "title": "Simulateur d'Importation de Véhicules en Algérie",
+        "introduction": "Bienvenue sur le simulateur d'importation de véhicules en Algérie. Ce simulateur vous aidera à estimer les coûts associés à l'importation de votre véhicule, en fonction des réglementations en vigueur.",
+        "fpdf_missing": "Le module 'fpdf' n'est pas installé. Veuillez l'installer pour pouvoir générer des rapports PDF.",
+        "fpdf_required": "La génération de rapports PDF nécessite l'installation du module 'fpdf'. Veuillez l'installer pour utiliser cette fonctionnalité.",
+        "sidebar_header": "Informations sur l'Importateur et Conversion de Devises",
+        "select_status": "Sélectionnez votre statut",
+        "status_options": ("Particulier Résident", "Particulier Non-Résident (Binational)"),
+        "conversion_subheader": "Taux de Conversion",
+        "conversion_label": "Taux de conversion DZD par EUR",
+        "vat_subheader": "Taux de TVA",
+        "vat_label": "Taux de TVA en Algérie (%)",
+        "parallel_rate_subheader": "Taux de Change du Marché Parallèle (Optionnel)",
+        "use_parallel_rate_label": "Utiliser le taux de change du marché parallèle",
+        "parallel_rate_label": "Entrez le taux de change du marché parallèle DZD par EUR",
+        "parallel_rate_help": "Utilisez ce taux si vous souhaitez calculer le bénéfice en utilisant le taux de change du marché parallèle.",
+        "tabs": ("📄 Informations Véhicule", "💰 Coûts & Taxes", "📈 Revente & Bénéfice", "📋 Résumé & Rapport"),
+        "vehicle_info_header": "Informations sur le Véhicule",
+        "manufacture_date_label": "Date de fabrication du véhicule",
+        "year_label": "Année",
+        "month_label": "Mois",
+        "fuel_label": "Type de carburant",
+        "fuel_options": ("Essence", "Diesel"),
+        "fuel_help": "Sélectionnez le type de carburant du véhicule.",
+        "cylindree_label": "Cylindrée (en cm³)",
+        "cylindree_help": "Entrez la cylindrée du moteur en centimètres cubes (cm³).",
+        "etat_label": "État de conformité",
+        "etat_options": ("Bon état de marche", "Défaut mineur", "Défaut majeur"),
+        "etat_help": "Sélectionnez l'état de conformité du véhicule. Un bon état de marche est requis. Défauts mineurs ou majeurs affecteront l'éligibilité.",
+        "no_models_warning": "Aucun modèle disponible pour cette marque.",
+        "price_input_label": "Prix du véhicule",
+        "price_currency_label": "Devise du prix",
+        "price_currency_options": ("DZD", "EUR"),
+        "price_dzd_label": "Prix du véhicule (en DZD)",
+        "price_eur_label": "Prix du véhicule (en EUR)",
+        "conversion_note": "**Note :** 15 000 000 DZD équivaut à 1 000 EUR.",
+        "conversion_note_help": "En dialecte algérien, 15 000 000 DZD équivaut à 1 000 EUR.",
+        "price_type_label": "Type de prix",
+        "price_type_options": ("HT (Hors Taxe)", "TTC (Toutes Taxes Comprises)"),
+        "origin_vat_label": "TVA du pays d'origine incluse ?",
+        "origin_vat_options": ("Oui", "Non"),
+        "origin_vat_help": "Si le prix du véhicule inclut la TVA du pays d'origine (par exemple, la France), sélectionnez 'Oui'. Sinon, sélectionnez 'Non'.",
+        "price_ht_origin_display": "**Prix HT sans TVA du pays d'origine :** {dzd} / {eur:,.2f} EUR",
+        "eligibility_header": "Éligibilité du Véhicule",
+        "eligibility_success": "Le véhicule est éligible à l'importation.",
+        "eligibility_error": "Le véhicule n'est pas éligible à l'importation pour les raisons suivantes :",
+        "reason_resident_age": "Le véhicule doit avoir moins de 3 ans pour les particuliers résidents.",
+        "reason_non_resident": "Conditions spécifiques à Particulier Non-Résident à implémenter.",
+        "reason_diesel_cylindree": "La cylindrée maximale pour les moteurs diesel est de 2000 cm³.",
+        "reason_essence_cylindree": "La cylindrée maximale pour les moteurs à essence est de 1800 cm³.",
+        "reason_etat": "Le véhicule doit être en bon état de marche, sans défaut majeur ou critique.",
+        "costs_header": "Estimation des Coûts et Taxes",
+        "costs_details_header": "Détails des Coûts et Taxes",
+        "column_description": "Description",
+        "column_dzd": "En DZD",
+        "column_eur": "En EUR",
+        "row_price_ht_origin": "Prix HT sans TVA du pays d'origine",
+        "row_customs_duties": "Droits de Douane ({rate}%)",
+        "row_tic": "TIC ({rate}%)",
+        "row_additional_fees": "Frais Annexes",
+        "row_before_vat": "Montant Avant TVA",
+        "row_vat": "TVA Algérienne ({rate}%)",
+        "row_total": "Total Estimé",
+        "row_resale_price": "Prix de Revente",
+        "row_benefit": "Bénéfice Potentiel",
+        "vat_note": "**Note :** La TVA est calculée sur la somme des éléments précédents.",
+        "vat_note_help": "La TVA est calculée sur le montant avant TVA, incluant le prix HT, les droits de douane, la TIC et les frais annexes.",
+        "resale_header": "Calcul du Bénéfice de Revente",
+        "resale_eur_label": "Prix de revente (en EUR)",
+        "resale_dzd_label": "Prix de revente (en DZD)",
+        "resale_price_display": "**Prix de revente en DZD :** {dzd} / {eur:,.2f} EUR",
+        "minimum_resale_price_display": "**Prix minimum de revente nécessaire :** {dzd} / {eur:,.2f} EUR",
+        "resale_below_minimum": "Le prix de revente saisi est inférieur au prix minimum requis pour atteindre le bénéfice souhaité.",
+        "fleet_header": "Devis Flotte (plusieurs véhicules)",
+        "fleet_upload_label": "Fichier CSV des véhicules",
+        "fleet_upload_help": "Une ligne par véhicule avec les colonnes : marque, modele, prix_dzd (prix HT), carburant, cylindree, prix_revente_dzd.",
+        "fleet_missing_columns": "Colonnes manquantes dans le fichier : {columns}",
+        "fleet_invalid_file": "Le fichier CSV de la flotte est illisible : {error}",
+        "fleet_invalid_value": "Valeur numérique invalide « {value} » dans la colonne {column}, ligne {line} du fichier.",
+        "fleet_invalid_fuel": "Type de carburant non reconnu « {value} » dans la colonne carburant, ligne {line} du fichier (valeurs acceptées : {accepted}).",
+        "fleet_columns": ("Marque", "Modèle", "Prix HT (DZD)", "Droits (DZD)", "TIC (DZD)", "TVA (DZD)", "Total (DZD)", "Revente (DZD)", "Bénéfice (DZD)"),
+        "fleet_table_title": "Détail de la Flotte",
+        "fleet_summary_title": "Synthèse de la Flotte",
+        "fleet_summary_columns": ("Indicateur", "Montant (DZD)"),
+        "fleet_summary_labels": (
+            "Nombre de véhicules", "Total des prix HT", "Total des droits de douane", "Total de la TIC",
+            "Total de la TVA", "Coût total estimé", "Total des prix de revente", "Bénéfice attendu"
+        ),
+        "summary_header": "Résumé des Coûts et Taxes",
+        "document_header": "Documents Requis pour le Dédouanement",
+        "document_list": """
+1. **Copie de la pièce d'identité** ou carte de résident.
+2. **Certificat de résidence**.
+3. **Certificat d'immatriculation** du véhicule à l'étranger.
+4. **Facture d'achat** ou contrat de vente.
+5. **Document attestant le bon état de marche** du véhicule (datant de moins de trois mois).
+6. **Rapport d'expertise de conformité** établi par un expert agréé.
+""",
+        "restrictions_header": "Restrictions Supplémentaires",
+        "restrictions_list": """
+- **Durée d'Incessibilité** : Le véhicule importé ne peut être cédé avant une période de trois ans suivant son importation.
+- **Normes Environnementales** : Les véhicules doivent respecter les normes d'émissions en vigueur en Algérie.
+""",
+        "download_header": "Télécharger le Rapport d'Estimation",
+        "download_button": "Télécharger le Rapport",
+        "report_filename": "rapport_importation.pdf",
+        "pdf_error": "Erreur lors de la génération du PDF : {error}",
+        "pdf_title": "Rapport d'Importation de Véhicule",
+        "pdf_general_info": "Informations Générales",
+        "pdf_general_info_body": """
+**Statut de l'Importateur :** {status}
+
+**Taux de Conversion (DZD/EUR) :** {conversion_rate}
+
+**Marque :** {make}
+
+**Modèle :** {model}
+
+**Date de Fabrication :** {year} - {month}
+
+**Type de Carburant :** {fuel}
+
+**Cylindrée :** {cylindree} cm³
+
+**État de Conformité :** {etat}
+
+**Prix du Véhicule :** {price_dzd} / {price_eur:,.2f} EUR
+""",
+        "pdf_costs_table": "Coûts et Taxes",
+        "pdf_benefit_body": """
+**Prix de Revente :** {resale_dzd} / {resale_eur:,.2f} EUR
+
+**Bénéfice Potentiel :** {benefit_dzd} / {benefit_eur:,.2f} EUR
+
+**Prix minimum de revente nécessaire :** {minimum_dzd} / {minimum_eur:,.2f} EUR
+""",
+        "months": (
+            "Janvier", "Février", "Mars", "Avril", "Mai", "Juin",
+            "Juillet", "Août", "Septembre", "Octobre", "Novembre", "Décembre"
+        ),
+        "millions": "millions",
+        "select_make_label": "Sélectionnez la marque",
+        "select_model_label": "Sélectionnez le modèle",
+        "loading_models": "Chargement des modèles...",
+        "resale_price_label": "Prix de revente souhaité en Algérie",
+        "resale_price_currency_label": "Devise du prix de revente",
+        "resale_price_currency_options": ("DZD", "EUR"),
+        "benefit_label": "Bénéfice potentiel",
+        "desired_profit_label": "Bénéfice minimum souhaité",
+        "minimum_resale_price_label": "Prix minimum de revente nécessaire",
+        "profit_currency_label": "Devise du bénéfice",
+        "price_type_ht": "Hors Taxe (HT)",
+        "price_type_ttc": "Toutes Taxes Comprises (TTC)",
+        "tax_rate": "19%"  # Taux de TVA par défaut
+    }
+
+def catalogue_english():
+    return {
+        "pdf_language": "English",
+        "title": "Vehicle Import Simulator for Algeria",
+        "introduction": "Welcome to the Algeria vehicle import simulator. This simulator will help you estimate the costs of importing your vehicle under the regulations currently in force.",
+        "fpdf_missing": "The 'fpdf' module is not installed. Please install it to generate PDF reports.",
+        "fpdf_required": "Generating PDF reports requires the 'fpdf' module. Please install it to use this feature.",
+        "sidebar_header": "Importer Information and Currency Conversion",
+        "select_status": "Select your status",
+        "status_options": ("Resident Individual", "Non-Resident Individual (Dual National)"),
+        "conversion_subheader": "Conversion Rate",
+        "conversion_label": "Conversion rate DZD per EUR",
+        "vat_subheader": "VAT Rate",
+        "vat_label": "VAT rate in Algeria (%)",
+        "parallel_rate_subheader": "Parallel Market Exchange Rate (Optional)",
+        "use_parallel_rate_label": "Use the parallel market exchange rate",
+        "parallel_rate_label": "Enter the parallel market exchange rate DZD per EUR",
+        "parallel_rate_help": "Use this rate if you want the profit to be calculated with the parallel market exchange rate.",
+        "tabs": ("📄 Vehicle Information", "💰 Costs & Taxes", "📈 Resale & Profit", "📋 Summary & Report"),
+        "vehicle_info_header": "Vehicle Information",
+        "manufacture_date_label": "Vehicle manufacture date",
+        "year_label": "Year",
+        "month_label": "Month",
+        "fuel_label": "Fuel type",
+        "fuel_options": ("Petrol", "Diesel"),
+        "fuel_help": "Select the vehicle's fuel type.",
+        "cylindree_label": "Engine displacement (cm³)",
+        "cylindree_help": "Enter the engine displacement in cubic centimetres (cm³).",
+        "etat_label": "Roadworthiness",
+        "etat_options": ("Good working order", "Minor defect", "Major defect"),
+        "etat_help": "Select the vehicle's roadworthiness. Good working order is required. Minor or major defects will affect eligibility.",
+        "no_models_warning": "No model available for this make.",
+        "price_input_label": "Vehicle price",
+        "price_currency_label": "Price currency",
+        "price_currency_options": ("DZD", "EUR"),
+        "price_dzd_label": "Vehicle price (in DZD)",
+        "price_eur_label": "Vehicle price (in EUR)",
+        "conversion_note": "**Note:** 15,000,000 DZD is equivalent to 1,000 EUR.",
+        "conversion_note_help": "In Algerian usage, 15,000,000 DZD is equivalent to 1,000 EUR.",
+        "price_type_label": "Price type",
+        "price_type_options": ("Excl. tax", "Incl. all taxes"),
+        "origin_vat_label": "Country of origin VAT included?",
+        "origin_vat_options": ("Yes", "No"),
+        "origin_vat_help": "If the vehicle price includes the VAT of the country of origin (for example France), select 'Yes'. Otherwise, select 'No'.",
+        "price_ht_origin_display": "**Price excl. country of origin VAT:** {dzd} / {eur:,.2f} EUR",
+        "eligibility_header": "Vehicle Eligibility",
+        "eligibility_success": "The vehicle is eligible for import.",
+        "eligibility_error": "The vehicle is not eligible for import for the following reasons:",
+        "reason_resident_age": "The vehicle must be less than 3 years old for resident individuals.",
+        "reason_non_resident": "Conditions specific to non-resident individuals are not implemented yet.",
+        "reason_diesel_cylindree": "The maximum displacement for diesel engines is 2000 cm³.",
+        "reason_essence_cylindree": "The maximum displacement for petrol engines is 1800 cm³.",
+        "reason_etat": "The vehicle must be in good working order, without major or critical defects.",
+        "costs_header": "Cost and Tax Estimate",
+        "costs_details_header": "Cost and Tax Details",
+        "column_description": "Description",
+        "column_dzd": "In DZD",
+        "column_eur": "In EUR",
+        "row_price_ht_origin": "Price excl. country of origin VAT",
+        "row_customs_duties": "Customs Duties ({rate}%)",
+        "row_tic": "TIC ({rate}%)",
+        "row_additional_fees": "Additional Fees",
+        "row_before_vat": "Amount Before VAT",
+        "row_vat": "Algerian VAT ({rate}%)",
+        "row_total": "Estimated Total",
+        "row_resale_price": "Resale Price",
+        "row_benefit": "Potential Profit",
+        "vat_note": "**Note:** VAT is calculated on the sum of the items above.",
+        "vat_note_help": "VAT is calculated on the amount before VAT, including the price excl. tax, customs duties, TIC and additional fees.",
+        "resale_header": "Resale Profit Calculation",
+        "resale_eur_label": "Resale price (in EUR)",
+        "resale_dzd_label": "Resale price (in DZD)",
+        "resale_price_display": "**Resale price in DZD:** {dzd} / {eur:,.2f} EUR",
+        "minimum_resale_price_display": "**Minimum resale price required:** {dzd} / {eur:,.2f} EUR",
+        "resale_below_minimum": "The resale price entered is below the minimum price required to reach the desired profit.",
+        "fleet_header": "Fleet Quote (several vehicles)",
+        "fleet_upload_label": "Vehicles CSV file",
+        "fleet_upload_help": "One row per vehicle with the columns: marque, modele, prix_dzd (price excl. tax), carburant, cylindree, prix_revente_dzd.",
+        "fleet_missing_columns": "Missing columns in the file: {columns}",
+        "fleet_invalid_file": "The fleet CSV file cannot be read: {error}",
+        "fleet_invalid_value": "Invalid numeric value \"{value}\" in column {column}, line {line} of the file.",
+        "fleet_invalid_fuel": "Unrecognised fuel type \"{value}\" in column carburant, line {line} of the file (accepted values: {accepted}).",
+        "fleet_columns": ("Make", "Model", "Price excl. tax (DZD)", "Duties (DZD)", "TIC (DZD)", "VAT (DZD)", "Total (DZD)", "Resale (DZD)", "Profit (DZD)"),
+        "fleet_table_title": "Fleet Details",
+        "fleet_summary_title": "Fleet Summary",
+        "fleet_summary_columns": ("Indicator", "Amount (DZD)"),
+        "fleet_summary_labels": (
+            "Number of vehicles", "Total prices excl. tax", "Total customs duties", "Total TIC",
+            "Total VAT", "Estimated total cost", "Total resale prices", "Expected profit"
+        ),
+        "summary_header": "Cost and Tax Summary",
+        "document_header": "Documents Required for Customs Clearance",
+        "document_list": """
+1. **Copy of identity document** or residence card.
+2. **Certificate of residence**.
+3. **Foreign registration certificate** of the vehicle.
+4. **Purchase invoice** or sales contract.
+5. **Document certifying the good working order** of the vehicle (less than three months old).
+6. **Conformity inspection report** issued by an approved expert.
+""",
+        "restrictions_header": "Additional Restrictions",
+        "restrictions_list": """
+- **Non-transferability period**: The imported vehicle cannot be sold within three years of its import.
+- **Environmental standards**: Vehicles must comply with the emission standards in force in Algeria.
+""",
+        "download_header": "Download the Estimate Report",
+        "download_button": "Download Report",
+        "report_filename": "import_report.pdf",
+        "pdf_error": "Error while generating the PDF: {error}",
+        "pdf_title": "Vehicle Import Report",
+        "pdf_general_info": "General Information",
+        "pdf_general_info_body": """
+**Importer Status:** {status}
+
+**Conversion Rate (DZD/EUR):** {conversion_rate}
+
+**Make:** {make}
+
+**Model:** {model}
+
+**Manufacture Date:** {year} - {month}
+
+**Fuel Type:** {fuel}
+
+**Engine Displacement:** {cylindree} cm³
+
+**Roadworthiness:** {etat}
+
+**Vehicle Price:** {price_dzd} / {price_eur:,.2f} EUR
+""",
+        "pdf_costs_table": "Costs and Taxes",
+        "pdf_benefit_body": """
+**Resale Price:** {resale_dzd} / {resale_eur:,.2f} EUR
+
+**Potential Profit:** {benefit_dzd} / {benefit_eur:,.2f} EUR
+
+**Minimum resale price required:** {minimum_dzd} / {minimum_eur:,.2f} EUR
+""",
+        "months": (
+            "January", "February", "March", "April", "May", "June",
+            "July", "August", "September", "October", "November", "December"
+        ),
+        "millions": "millions",
+        "select_make_label": "Select the make",
+        "select_model_label": "Select the model",
+        "loading_models": "Loading models...",
+        "resale_price_label": "Desired resale price in Algeria",
+        "resale_price_currency_label": "Resale price currency",
+        "resale_price_currency_options": ("DZD", "EUR"),
+        "benefit_label": "Potential profit",
+        "desired_profit_label": "Minimum desired profit",
+        "minimum_resale_price_label": "Minimum resale price required",
+        "profit_currency_label": "Profit currency",
+        "price_type_ht": "Excl. tax",
+        "price_type_ttc": "Incl. all taxes",
+        "tax_rate": "19%"  # Default VAT rate
+    }
+
+def catalogue_arabic():
+    return {
+        # Les polices de base de FPDF ne couvrent que le latin-1 : le rapport PDF est rédigé en français
+        "pdf_language": "French",
+        "title": "محاكي استيراد السيارات إلى الجزائر",
+        "introduction": "مرحبًا بكم في محاكي استيراد السيارات إلى الجزائر. سيساعدكم هذا المحاكي على تقدير تكاليف استيراد سيارتكم وفقًا للتنظيمات المعمول بها.",
+        "fpdf_missing": "الوحدة 'fpdf' غير مثبتة. يرجى تثبيتها لتتمكنوا من إنشاء تقارير PDF.",
+        "fpdf_required": "يتطلب إنشاء تقارير PDF تثبيت الوحدة 'fpdf'. يرجى تثبيتها لاستخدام هذه الميزة.",
+        "sidebar_header": "معلومات المستورد وتحويل العملات",
+        "select_status": "اختر وضعيتك",
+        "status_options": ("فرد مقيم", "فرد غير مقيم (مزدوج الجنسية)"),
+        "conversion_subheader": "سعر الصرف",
+        "conversion_label": "سعر الصرف بالدينار مقابل اليورو",
+        "vat_subheader": "نسبة الرسم على القيمة المضافة",
+        "vat_label": "نسبة الرسم على القيمة المضافة في الجزائر (%)",
+        "parallel_rate_subheader": "سعر الصرف في السوق الموازية (اختياري)",
+        "use_parallel_rate_label": "استخدام سعر الصرف في السوق الموازية",
+        "parallel_rate_label": "أدخل سعر الصرف في السوق الموازية بالدينار مقابل اليورو",
+        "parallel_rate_help": "استخدم هذا السعر إذا أردت حساب الربح بسعر الصرف في السوق الموازية.",
+        "tabs": ("📄 معلومات السيارة", "💰 التكاليف والرسوم", "📈 إعادة البيع والربح", "📋 الملخص والتقرير"),
+        "vehicle_info_header": "معلومات السيارة",
+        "manufacture_date_label": "تاريخ صنع السيارة",
+        "year_label": "السنة",
+        "month_label": "الشهر",
+        "fuel_label": "نوع الوقود",
+        "fuel_options": ("بنزين", "ديزل"),
+        "fuel_help": "اختر نوع وقود السيارة.",
+        "cylindree_label": "سعة المحرك (سم³)",
+        "cylindree_help": "أدخل سعة المحرك بالسنتيمتر المكعب (سم³).",
+        "etat_label": "حالة المطابقة",
+        "etat_options": ("صالحة للسير", "عيب طفيف", "عيب كبير"),
+        "etat_help": "اختر حالة مطابقة السيارة. يجب أن تكون السيارة صالحة للسير. العيوب الطفيفة أو الكبيرة تؤثر على الأهلية.",
+        "no_models_warning": "لا يوجد طراز متاح لهذه العلامة.",
+        "price_input_label": "سعر السيارة",
+        "price_currency_label": "عملة السعر",
+        "price_currency_options": ("DZD", "EUR"),
+        "price_dzd_label": "سعر السيارة (بالدينار)",
+        "price_eur_label": "سعر السيارة (باليورو)",
+        "conversion_note": "**ملاحظة:** 15 000 000 دينار تعادل 1 000 يورو.",
+        "conversion_note_help": "باللهجة الجزائرية، 15 000 000 دينار تعادل 1 000 يورو.",
+        "price_type_label": "نوع السعر",
+        "price_type_options": ("خارج الرسوم", "شامل جميع الرسوم"),
+        "origin_vat_label": "هل الرسم على القيمة المضافة لبلد المنشأ مشمول؟",
+        "origin_vat_options": ("نعم", "لا"),
+        "origin_vat_help": "إذا كان سعر السيارة يشمل الرسم على القيمة المضافة لبلد المنشأ (مثل فرنسا)، اختر 'نعم'. وإلا اختر 'لا'.",
+        "price_ht_origin_display": "**السعر خارج الرسم على القيمة المضافة لبلد المنشأ:** {dzd} / {eur:,.2f} EUR",
+        "eligibility_header": "أهلية السيارة",
+        "eligibility_success": "السيارة مؤهلة للاستيراد.",
+        "eligibility_error": "السيارة غير مؤهلة للاستيراد للأسباب التالية:",
+        "reason_resident_age": "يجب أن يقل عمر السيارة عن 3 سنوات بالنسبة للأفراد المقيمين.",
+        "reason_non_resident": "الشروط الخاصة بالأفراد غير المقيمين لم تُنفذ بعد.",
+        "reason_diesel_cylindree": "السعة القصوى لمحركات الديزل هي 2000 سم³.",
+        "reason_essence_cylindree": "السعة القصوى لمحركات البنزين هي 1800 سم³.",
+        "reason_etat": "يجب أن تكون السيارة صالحة للسير، دون عيوب كبيرة أو خطيرة.",
+        "costs_header": "تقدير التكاليف والرسوم",
+        "costs_details_header": "تفاصيل التكاليف والرسوم",
+        "column_description": "البيان",
+        "column_dzd": "بالدينار",
+        "column_eur": "باليورو",
+        "row_price_ht_origin": "السعر خارج الرسم على القيمة المضافة لبلد المنشأ",
+        "row_customs_duties": "الحقوق الجمركية ({rate}%)",
+        "row_tic": "الرسم الداخلي على الاستهلاك ({rate}%)",
+        "row_additional_fees": "مصاريف إضافية",
+        "row_before_vat": "المبلغ قبل الرسم على القيمة المضافة",
+        "row_vat": "الرسم الجزائري على القيمة المضافة ({rate}%)",
+        "row_total": "المجموع التقديري",
+        "row_resale_price": "سعر إعادة البيع",
+        "row_benefit": "الربح المحتمل",
+        "vat_note": "**ملاحظة:** يُحسب الرسم على القيمة المضافة على مجموع العناصر السابقة.",
+        "vat_note_help": "يُحسب الرسم على القيمة المضافة على المبلغ قبل الرسم، بما في ذلك السعر خارج الرسوم والحقوق الجمركية والرسم الداخلي على الاستهلاك والمصاريف الإضافية.",
+        "resale_header": "حساب الفائدة من إعادة البيع",
+        "resale_eur_label": "سعر إعادة البيع (باليورو)",
+        "resale_dzd_label": "سعر إعادة البيع (بالدينار)",
+        "resale_price_display": "**سعر إعادة البيع بالدينار:** {dzd} / {eur:,.2f} EUR",
+        "minimum_resale_price_display": "**السعر الأدنى اللازم لإعادة البيع:** {dzd} / {eur:,.2f} EUR",
+        "resale_below_minimum": "سعر إعادة البيع المدخل أقل من السعر الأدنى اللازم لتحقيق الربح المرغوب.",
+        "fleet_header": "عرض أسعار لأسطول (عدة سيارات)",
+        "fleet_upload_label": "ملف CSV للسيارات",
+        "fleet_upload_help": "سطر لكل سيارة بالأعمدة: marque، modele، prix_dzd (السعر خارج الرسوم)، carburant، cylindree، prix_revente_dzd.",
+        "fleet_missing_columns": "أعمدة ناقصة في الملف: {columns}",
+        "fleet_invalid_file": "تعذرت قراءة ملف CSV الخاص بالأسطول: {error}",
+        "fleet_invalid_value": "قيمة رقمية غير صالحة «{value}» في العمود {column}، السطر {line} من الملف.",
+        "fleet_invalid_fuel": "نوع وقود غير معروف «{value}» في العمود carburant، السطر {line} من الملف (القيم المقبولة: {accepted}).",
+        "fleet_columns": ("العلامة", "الطراز", "السعر خارج الرسوم (دج)", "الحقوق (دج)", "الرسم الداخلي (دج)", "الرسم على القيمة المضافة (دج)", "المجموع (دج)", "إعادة البيع (دج)", "الربح (دج)"),
+        "fleet_summary_columns": ("المؤشر", "المبلغ (دج)"),
+        "fleet_summary_labels": (
+            "عدد السيارات", "مجموع الأسعار خارج الرسوم", "مجموع الحقوق الجمركية", "مجموع الرسم الداخلي على الاستهلاك",
+            "مجموع الرسم على القيمة المضافة", "التكلفة الإجمالية التقديرية", "مجموع أسعار إعادة البيع", "الربح المتوقع"
+        ),
+        "summary_header": "ملخص التكاليف والرسوم",
+        "document_header": "الوثائق المطلوبة للتخليص الجمركي",
+        "document_list": """
+1. **نسخة من بطاقة الهوية** أو بطاقة الإقامة.
+2. **شهادة الإقامة**.
+3. **شهادة تسجيل** السيارة في الخارج.
+4. **فاتورة الشراء** أو عقد البيع.
+5. **وثيقة تثبت صلاحية السيارة للسير** (لا يتجاوز تاريخها ثلاثة أشهر).
+6. **تقرير خبرة المطابقة** صادر عن خبير معتمد.
+""",
+        "restrictions_header": "قيود إضافية",
+        "restrictions_list": """
+- **مدة عدم التنازل**: لا يمكن التنازل عن السيارة المستوردة قبل مرور ثلاث سنوات على استيرادها.
+- **المعايير البيئية**: يجب أن تحترم السيارات معايير الانبعاثات المعمول بها في الجزائر.
+""",
+        "download_header": "تحميل تقرير التقدير",
+        "download_button": "تحميل التقرير",
+        "report_filename": "rapport_importation.pdf",
+        "pdf_error": "خطأ أثناء إنشاء ملف PDF: {error}",
+        "months": (
+            "جانفي", "فيفري", "مارس", "أفريل", "ماي", "جوان",
+            "جويلية", "أوت", "سبتمبر", "أكتوبر", "نوفمبر", "ديسمبر"
+        ),
+        "millions": "مليون",
+        "select_make_label": "اختر العلامة",
+        "select_model_label": "اختر الطراز",
+        "loading_models": "جارٍ تحميل الطرازات...",
+        "resale_price_label": "سعر إعادة البيع المرغوب في الجزائر",
+        "resale_price_currency_label": "عملة سعر إعادة البيع",
+        "resale_price_currency_options": ("DZD", "EUR"),
+        "benefit_label": "الربح المحتمل",
+        "desired_profit_label": "الحد الأدنى للربح المرغوب",
+        "minimum_resale_price_label": "السعر الأدنى اللازم لإعادة البيع",
+        "profit_currency_label": "عملة الربح",
+        "price_type_ht": "خارج الرسوم",
+        "price_type_ttc": "شامل جميع الرسوم",
+        "tax_rate": "19%"  # النسبة الافتراضية
+    }
+
+CATALOG_SOURCES = {
+    "French": catalogue_french,
+    "English": catalogue_english,
+    "Arabic": catalogue_arabic,
+}
+
+# Noms des langues dans le sélecteur (sans compiler les catalogues correspondants)
+LANGUAGE_NAMES = {
+    "French": "Français",
+    "English": "English",
+    "Arabic": "العربية",
+}
+
+# Langue de référence : ses entrées complètent les catalogues incomplets
+REFERENCE_LANGUAGE = "French"
+
+# Fonction pour compiler une entrée de catalogue en valeur immuable et internée
+def compiler_entree(value):
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(compiler_entree(item) for item in value)
+    return value
+
+# Catalogues compilés, conservés pour toute la durée du processus (ce module n'est
+# importé qu'une fois, contrairement au script Streamlit réexécuté à chaque interaction)
+_CATALOGS = {}
+_CATALOGS_LOCK = threading.RLock()
+
+# Catalogue compilé une seule fois par processus et par langue, au premier usage
+def get_catalog(lang):
+    catalog = _CATALOGS.get(lang)
+    if catalog is None:
+        with _CATALOGS_LOCK:
+            catalog = _CATALOGS.get(lang)
+            if catalog is None:
+                source = CATALOG_SOURCES[lang]()
+                if lang != REFERENCE_LANGUAGE:
+                    source = {**get_catalog(REFERENCE_LANGUAGE), **source}
+                catalog = MappingProxyType({sys.intern(key): compiler_entree(value) for key, value in source.items()})
+                _CATALOGS[lang] = catalog
+    return catalog
+
+# Fonction pour obtenir les textes en fonction de la langue sélectionnée
+def get_text(lang, key):
+    return get_catalog(lang)[key]
+
+# Types de carburant reconnus dans les fichiers importés, quelle que soit leur langue,
+# associés à leur position dans "fuel_options" (0 : essence, 1 : diesel)
+FUEL_ALIASES = MappingProxyType({
+    "essence": 0,
+    "petrol": 0,
+    "gasoline": 0,
+    "بنزين": 0,
+    "diesel": 1,
+    "gasoil": 1,
+    "ديزل": 1,
+})
@@ -1,89 +1,12 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import html
 from io import BytesIO
 from datetime import datetime
 
-# Tentative d'importation de FPDF avec gestion des erreurs
-try:
-    from fpdf import FPDF
-    FPDF_AVAILABLE = True
-except ModuleNotFoundError:
-    FPDF_AVAILABLE = False
-    st.error("Le module 'fpdf' n'est pas installé. Veuillez l'installer pour pouvoir générer des rapports PDF.")
-
-# Dictionnaire des textes pour les différentes langues
-LANGUAGE = {
-    "French": {
-        "title": "Simulateur d'Importation de Véhicules en Algérie",
-        "introduction": "Bienvenue sur le simulateur d'importation de véhicules en Algérie. Ce simulateur vous aidera à estimer les coûts associés à l'importation de votre véhicule, en fonction des réglementations en vigueur.",
-        "sidebar_header": "Informations sur l'Importateur et Conversion de Devises",
-        "select_status": "Sélectionnez votre statut",
-        "status_options": ("Particulier Résident", "Particulier Non-Résident (Binational)"),
-        "conversion_subheader": "Taux de Conversion",
-        "conversion_label": "Taux de conversion DZD par EUR",
-        "vat_subheader": "Taux de TVA",
-        "vat_label": "Taux de TVA en Algérie (%)",
-        "vehicle_info_header": "Informations sur le Véhicule",
-        "manufacture_date_label": "Date de fabrication du véhicule",
-        "fuel_label": "Type de carburant",
-        "fuel_options": ("Essence", "Diesel"),
-        "cylindree_label": "Cylindrée (en cm³)",
-        "etat_label": "État de conformité",
-        "etat_options": ("Bon état de marche", "Défaut mineur", "Défaut majeur"),
-        "price_input_label": "Prix du véhicule",
-        "price_currency_label": "Devise du prix",
-        "price_currency_options": ("DZD", "EUR"),
-        "price_type_label": "Type de prix",
-        "price_type_options": ("HT (Hors Taxe)", "TTC (Toutes Taxes Comprises)"),
-        "origin_vat_label": "TVA du pays d'origine incluse ?",
-        "origin_vat_options": ("Oui", "Non"),
-        "costs_header": "Estimation des Coûts et Taxes",
-        "eligibility_success": "Le véhicule est éligible à l'importation.",
-        "eligibility_error": "Le véhicule n'est pas éligible à l'importation pour les raisons suivantes :",
-        "summary_header": "Résumé des Coûts et Taxes",
-        "document_header": "Documents Requis pour le Dédouanement",
-        "document_list": """
-1. **Copie de la pièce d'identité** ou carte de résident.
-2. **Certificat de résidence**.
-3. **Certificat d'immatriculation** du véhicule à l'étranger.
-4. **Facture d'achat** ou contrat de vente.
-5. **Document attestant le bon état de marche** du véhicule (datant de moins de trois mois).
-6. **Rapport d'expertise de conformité** établi par un expert agréé.
-""",
-        "restrictions_header": "Restrictions Supplémentaires",
-        "restrictions_list": """
-- **Durée d'Incessibilité** : Le véhicule importé ne peut être cédé avant une période de trois ans suivant son importation.
-- **Normes Environnementales** : Les véhicules doivent respecter les normes d'émissions en vigueur en Algérie.
-""",
-        "download_header": "Télécharger le Rapport d'Estimation",
-        "download_button": "Télécharger le Rapport",
-        "report_filename": "rapport_importation.pdf",
-        "months": [
-            "Janvier", "Février", "Mars", "Avril", "Mai", "Juin",
-            "Juillet", "Août", "Septembre", "Octobre", "Novembre", "Décembre"
-        ],
-        "select_make_label": "Sélectionnez la marque",
-        "select_model_label": "Sélectionnez le modèle",
-        "loading_models": "Chargement des modèles...",
-        "resale_price_label": "Prix de revente souhaité en Algérie",
-        "resale_price_currency_label": "Devise du prix de revente",
-        "resale_price_currency_options": ("DZD", "EUR"),
-        "benefit_label": "Bénéfice potentiel",
-        "desired_profit_label": "Bénéfice minimum souhaité",
-        "minimum_resale_price_label": "Prix minimum de revente nécessaire",
-        "profit_currency_label": "Devise du bénéfice",
-        "price_type_ht": "Hors Taxe (HT)",
-        "price_type_ttc": "Toutes Taxes Comprises (TTC)",
-        "tax_rate": "19%"  # Taux de TVA par défaut
-    },
-    "Arabic": {
-        # Vous pouvez ajouter les traductions en arabe ici si nécessaire.
-    }
-}
-
-# Fonction pour obtenir les textes en fonction de la langue sélectionnée
-def get_text(lang, key):
-    return LANGUAGE[lang][key]
+from catalogues import CATALOG_SOURCES, FUEL_ALIASES, LANGUAGE_NAMES, get_catalog, get_text
+from rapport_pdf import FPDF_AVAILABLE, ReportWorker, cle_rapport
 
 # Liste préenregistrée des marques et modèles courants
 MAKES_MODELS = {
@@ -99,65 +22,72 @@ MAKES_MODELS = {
     "Hyundai": ["i20", "i30", "Kona", "Santa Fe"]
 }
 
-# Classe pour générer le PDF
-if FPDF_AVAILABLE:
-    class PDF(FPDF):
-        def header(self):
-            # Titre
-            self.set_font('Arial', 'B', 16)
-            self.cell(0, 10, 'Rapport d\'Importation de Véhicule', ln=True, align='C')
-            self.ln(10)
-
-        def chapter_title(self, label):
-            # Sous-titre
-            self.set_font('Arial', 'B', 12)
-            self.cell(0, 10, label, ln=True)
-            self.ln(5)
-
-        def chapter_body(self, body):
-            # Corps du texte
-            self.set_font('Arial', '', 12)
-            for line in body.split('\n'):
-                self.multi_cell(0, 10, line)
-                self.ln()
-
-        def add_table(self, df, title):
-            self.set_font('Arial', 'B', 12)
-            self.cell(0, 10, title, ln=True)
-            self.ln(2)
-            # Table
-            self.set_font('Arial', 'B', 10)
-            col_width = (self.w - 2 * self.l_margin) / len(df.columns)
-            for col in df.columns:
-                self.cell(col_width, 10, col, border=1, align='C')
-            self.ln()
-            self.set_font('Arial', '', 10)
-            for index, row in df.iterrows():
-                for item in row:
-                    if isinstance(item, float) or isinstance(item, int):
-                        item_str = f"{item:,.2f}"
-                    else:
-                        item_str = str(item)
-                    self.cell(col_width, 10, item_str, border=1)
-                self.ln()
-            self.ln(10)
-
 # Fonction pour formater les montants en DZD avec équivalence en millions
-def format_dzd(amount):
+def format_dzd(amount, t):
     millions = amount / 10_000  # 1 million équivaut à 10 000 DZD
-    return f"{amount:,.2f} DZD ({int(millions)} millions)"
+    return f"{amount:,.2f} DZD ({int(millions)} {t['millions']})"
+
+# Fonction pour afficher une info-bulle HTML dont le texte provient du catalogue
+def info_bulle(texte, icone):
+    return f"<span title='{html.escape(texte, quote=True)}'>{icone}</span>"
+
+# Fonction pour construire les colonnes d'un tableau de montants dans la langue du catalogue
+def colonnes_montants(t, descriptions, montants_dzd, montants_eur):
+    return {
+        t["column_description"]: list(descriptions),
+        t["column_dzd"]: [format_dzd(montant, t) for montant in montants_dzd],
+        t["column_eur"]: [f"{montant:,.2f}" for montant in montants_eur],
+    }
+
+# Fonction pour obtenir les libellés des lignes de coûts et taxes
+def descriptions_couts(t, droits_douane_taux, tic_taux, tva_taux):
+    return [
+        t["row_price_ht_origin"],
+        t["row_customs_duties"].format(rate=droits_douane_taux),
+        t["row_tic"].format(rate=tic_taux),
+        t["row_additional_fees"],
+        t["row_before_vat"],
+        t["row_vat"].format(rate=tva_taux),
+        t["row_total"],
+    ]
+
+# Paramètres de la génération des rapports en arrière-plan
+REPORT_DEBOUNCE_SECONDS = 0.5  # Délai de stabilisation des saisies avant de lancer un rendu spéculatif
+REPORT_POLL_SECONDS = 0.5  # Intervalle de rafraîchissement de la barre de progression
+
+# Pool de génération partagé par toutes les sessions du processus
+@st.cache_resource
+def get_report_worker():
+    return ReportWorker()
+
+# Barre de progression rafraîchie seule ; la page est relancée une fois le rendu terminé
+@st.fragment(run_every=REPORT_POLL_SECONDS)
+def afficher_progression_rapport(report_job):
+    if report_job.future.done():
+        st.rerun()
+    st.progress(min(report_job.progress, 1.0))
 
 # Sélection de la langue
 st.sidebar.header("Language / اللغة")
-language = st.sidebar.selectbox("Choose your language / اختر لغتك", ("French", "Arabic"))
+language = st.sidebar.selectbox(
+    "Choose your language / اختر لغتك",
+    tuple(CATALOG_SOURCES),
+    format_func=LANGUAGE_NAMES.get
+)
 
 # Appliquer la langue sélectionnée
-texts = LANGUAGE[language]
+texts = get_catalog(language)
+
+# Le rapport PDF est rédigé dans la langue indiquée par le catalogue
+pdf_texts = get_catalog(texts["pdf_language"])
 
 # Configuration de la mise en page pour l'arabe (RTL) si nécessaire
 if language == "Arabic":
     st.markdown("<style>body {direction: rtl;}</style>", unsafe_allow_html=True)
 
+if not FPDF_AVAILABLE:
+    st.error(texts["fpdf_missing"])
+
 # Titre de l'application
 st.title(texts["title"])
 
@@ -194,21 +124,21 @@ with st.sidebar:
     )
 
     # 4. Taux de Change pour le Marché Parallèle (Optionnel)
-    st.sidebar.subheader("Taux de Change du Marché Parallèle (Optionnel)")
-    use_parallel_rate = st.sidebar.checkbox("Utiliser le taux de change du marché parallèle")
+    st.sidebar.subheader(texts["parallel_rate_subheader"])
+    use_parallel_rate = st.sidebar.checkbox(texts["use_parallel_rate_label"])
     if use_parallel_rate:
         parallel_rate = st.sidebar.number_input(
-            "Entrez le taux de change du marché parallèle DZD par EUR",
+            texts["parallel_rate_label"],
             min_value=1.0,
             value=150.0,
             step=1.0,
-            help="Utilisez ce taux si vous souhaitez calculer le bénéfice en utilisant le taux de change du marché parallèle."
+            help=texts["parallel_rate_help"]
         )
     else:
         parallel_rate = conversion_rate  # Utiliser le taux officiel par défaut
 
 # Utilisation des onglets pour organiser le contenu principal
-tabs = st.tabs(["📄 Informations Véhicule", "💰 Coûts & Taxes", "📈 Revente & Bénéfice", "📋 Résumé & Rapport"])
+tabs = st.tabs(list(texts["tabs"]))
 
 # **Onglet 1 : Informations Véhicule**
 with tabs[0]:
@@ -218,7 +148,7 @@ with tabs[0]:
         with col_year:
             current_year = datetime.now().year
             manufacture_year = st.number_input(
-                f"{texts['manufacture_date_label']} - Année",
+                f"{texts['manufacture_date_label']} - {texts['year_label']}",
                 min_value=1900,
                 max_value=current_year,
                 value=current_year,
@@ -227,7 +157,7 @@ with tabs[0]:
         with col_month:
             months = texts["months"]
             manufacture_month_name = st.selectbox(
-                f"{texts['manufacture_date_label']} - Mois",
+                f"{texts['manufacture_date_label']} - {texts['month_label']}",
                 months
             )
             manufacture_month = months.index(manufacture_month_name) + 1
@@ -263,7 +193,7 @@ with tabs[0]:
                 )
             else:
                 selected_model_name = None
-                st.warning("Aucun modèle disponible pour cette marque.")
+                st.warning(texts["no_models_warning"])
 
     # Prix du Véhicule avec sélection de la devise et HT/TTC
     st.subheader(texts["price_input_label"])
@@ -276,17 +206,13 @@ with tabs[0]:
                 key="currency_select"
             )
         with col_price:
-            if language == "French":
-                if price_currency == "DZD":
-                    price = st.number_input("Prix du véhicule (en DZD)", min_value=0, value=15000000.00, step=10000.00, key="price_dzd")
-                    price_eur = price / conversion_rate if conversion_rate != 0 else 0
-                    st.markdown("**Note :** 15 000 000 DZD équivaut à 1 000 EUR.")
-                else:
-                    price_eur = st.number_input("Prix du véhicule (en EUR)", min_value=0.0, value=1000.0, step=10.0, key="price_eur")
-                    price = price_eur * conversion_rate
+            if price_currency == "DZD":
+                price = st.number_input(texts["price_dzd_label"], min_value=0.0, value=15000000.00, step=10000.00, key="price_dzd")
+                price_eur = price / conversion_rate if conversion_rate != 0 else 0
+                st.markdown(texts["conversion_note"])
             else:
-                # Version arabe...
-                pass
+                price_eur = st.number_input(texts["price_eur_label"], min_value=0.0, value=1000.0, step=10.0, key="price_eur")
+                price = price_eur * conversion_rate
 
         with col_price_type:
             price_type = st.selectbox(
@@ -300,12 +226,12 @@ with tabs[0]:
         texts["origin_vat_label"],
         texts["origin_vat_options"],
         index=0,  # Par défaut sur 'Oui'
-        help="Si le prix du véhicule inclut la TVA du pays d'origine (par exemple, la France), sélectionnez 'Oui'. Sinon, sélectionnez 'Non'."
+        help=texts["origin_vat_help"]
     )
 
     # Ajuster le prix si la TVA du pays d'origine est récupérable
     origin_vat_rate = 20.0  # Taux de TVA du pays d'origine (France)
-    if origin_vat_included == "Oui" and price_type == "TTC (Toutes Taxes Comprises)":
+    if origin_vat_included == texts["origin_vat_options"][0] and price_type == texts["price_type_options"][1]:
         # Prix sans TVA du pays d'origine
         price_ht_origin = price / (1 + origin_vat_rate / 100)
     else:
@@ -315,62 +241,53 @@ with tabs[0]:
     TVA_TAUX = vat_rate  # Utilisation du taux de TVA modifiable
 
     # Afficher le prix ajusté
-    if language == "French":
-        st.markdown(f"**Prix HT sans TVA du pays d'origine :** {format_dzd(price_ht_origin)} / {price_ht_origin / conversion_rate:,.2f} EUR")
-    else:
-        # Version arabe...
-        pass
+    st.markdown(texts["price_ht_origin_display"].format(
+        dzd=format_dzd(price_ht_origin, texts),
+        eur=price_ht_origin / conversion_rate
+    ))
 
     # Autres Informations sur le Véhicule avec info-bulle pour la TIC
     with st.container():
         col_fuel, col_cylindree, col_etat = st.columns(3)
         with col_fuel:
             carburant = st.selectbox(texts["fuel_label"], texts["fuel_options"])
-            st.markdown(
-                "<span title='Sélectionnez le type de carburant du véhicule.'>🔍</span>",
-                unsafe_allow_html=True
-            )
+            st.markdown(info_bulle(texts["fuel_help"], "🔍"), unsafe_allow_html=True)
         with col_cylindree:
             cylindree = st.number_input(texts["cylindree_label"], min_value=0, max_value=10000, value=1800, step=100)
-            st.markdown(
-                "<span title='Entrez la cylindrée du moteur en centimètres cubes (cm³).'>🔍</span>",
-                unsafe_allow_html=True
-            )
+            st.markdown(info_bulle(texts["cylindree_help"], "🔍"), unsafe_allow_html=True)
         with col_etat:
             etat = st.selectbox(texts["etat_label"], texts["etat_options"])
-            st.markdown(
-                "<span title='Sélectionnez l\'état de conformité du véhicule. Un bon état de marche est requis. Défauts mineurs ou majeurs affecteront l\'éligibilité. '>🔍</span>",
-                unsafe_allow_html=True
-            )
+            st.markdown(info_bulle(texts["etat_help"], "🔍"), unsafe_allow_html=True)
 
     # Vérification de l'éligibilité du véhicule avec explications
-    st.subheader("Éligibilité du Véhicule")
+    st.subheader(texts["eligibility_header"])
     def verifier_eligibilite(age, carburant, cylindree, etat, importer_status, lang):
+        t = get_catalog(lang)
         eligibilite = True
         raisons = []
 
         # Vérification de l'âge du véhicule
-        if importer_status == LANGUAGE[lang]["status_options"][0]:  # Particulier Résident
+        if importer_status == t["status_options"][0]:  # Particulier Résident
             if age > 3:
                 eligibilite = False
-                raisons.append("Le véhicule doit avoir moins de 3 ans pour les particuliers résidents.")
-        elif importer_status == LANGUAGE[lang]["status_options"][1]:  # Particulier Non-Résident
-            raisons.append("Conditions spécifiques à Particulier Non-Résident à implémenter.")
+                raisons.append(t["reason_resident_age"])
+        elif importer_status == t["status_options"][1]:  # Particulier Non-Résident
+            raisons.append(t["reason_non_resident"])
 
         # Vérification du carburant et des normes
-        if carburant == LANGUAGE[lang]["fuel_options"][1]:  # Diesel
+        if carburant == t["fuel_options"][1]:  # Diesel
             if cylindree > 2000:
                 eligibilite = False
-                raisons.append("La cylindrée maximale pour les moteurs diesel est de 2000 cm³.")
-        elif carburant == LANGUAGE[lang]["fuel_options"][0]:  # Essence
+                raisons.append(t["reason_diesel_cylindree"])
+        elif carburant == t["fuel_options"][0]:  # Essence
             if cylindree > 1800:
                 eligibilite = False
-                raisons.append("La cylindrée maximale pour les moteurs à essence est de 1800 cm³.")
+                raisons.append(t["reason_essence_cylindree"])
 
         # Vérification de l'état de conformité
-        if etat != LANGUAGE[lang]["etat_options"][0]:  # Bon état de marche
+        if etat != t["etat_options"][0]:  # Bon état de marche
             eligibilite = False
-            raisons.append("Le véhicule doit être en bon état de marche, sans défaut majeur ou critique.")
+            raisons.append(t["reason_etat"])
 
         return eligibilite, raisons
 
@@ -387,12 +304,12 @@ with tabs[0]:
 # **Définitions des fonctions manquantes**
 
 def calcul_droits_douane(carburant, cylindree, lang):
-    if carburant == LANGUAGE[lang]["fuel_options"][0]:  # Essence
+    if carburant == get_text(lang, "fuel_options")[0]:  # Essence
         if cylindree <= 1800:
             taux = 15
         else:
             taux = 25
-    elif carburant == LANGUAGE[lang]["fuel_options"][1]:  # Diesel
+    elif carburant == get_text(lang, "fuel_options")[1]:  # Diesel
         if cylindree <= 2000:
             taux = 20
         else:
@@ -402,7 +319,7 @@ def calcul_droits_douane(carburant, cylindree, lang):
     return taux
 
 def calcul_TIC(carburant, cylindree, lang):
-    if carburant == LANGUAGE[lang]["fuel_options"][1]:  # Diesel
+    if carburant == get_text(lang, "fuel_options")[1]:  # Diesel
         if 2000 < cylindree <= 2500:
             return 2
         elif 2500 < cylindree <= 3000:
@@ -414,6 +331,98 @@ def calcul_TIC(carburant, cylindree, lang):
     else:
         return 0
 
+# Colonnes attendues dans le fichier CSV d'une flotte
+FLEET_COLUMNS = ("marque", "modele", "prix_dzd", "carburant", "cylindree", "prix_revente_dzd")
+FLEET_NUMERIC_COLUMNS = ("prix_dzd", "cylindree", "prix_revente_dzd")
+
+# Mise en page du tableau de flotte dans le PDF (marque et modèle peuvent être raccourcis)
+FLEET_TABLE_OPTIONS = {"row_height": 7, "font_size": 7, "text_columns": (0, 1)}
+
+# Fonction pour lire le fichier CSV d'une flotte (mis en cache par contenu)
+@st.cache_data
+def lire_flotte(data):
+    return pd.read_csv(BytesIO(data))
+
+# Fonction pour trouver la première valeur non numérique d'une flotte (colonne, ligne du fichier, valeur)
+def premiere_valeur_invalide(flotte):
+    for column in FLEET_NUMERIC_COLUMNS:
+        invalides = pd.to_numeric(flotte[column], errors="coerce").isna()
+        if invalides.any():
+            position = int(invalides.to_numpy().argmax())
+            value = flotte[column].iloc[position]
+            return column, position + 2, "" if pd.isna(value) else value  # L'en-tête est la ligne 1
+    return None
+
+# Fonction pour remplacer les caractères que les polices de base du PDF (latin-1) ne savent pas afficher
+def texte_pdf(texte):
+    return texte.encode("latin-1", "replace").decode("latin-1")
+
+# Fonction pour ramener les types de carburant d'une flotte à leur position dans "fuel_options"
+# (NaN pour un carburant non reconnu)
+def indices_carburant(flotte):
+    return flotte["carburant"].astype(str).str.strip().str.lower().map(FUEL_ALIASES)
+
+# Fonction pour trouver le premier type de carburant non reconnu d'une flotte (ligne du fichier, valeur)
+def premier_carburant_invalide(flotte):
+    invalides = indices_carburant(flotte).isna()
+    if invalides.any():
+        position = int(invalides.to_numpy().argmax())
+        value = flotte["carburant"].iloc[position]
+        return position + 2, "" if pd.isna(value) else value  # L'en-tête est la ligne 1
+    return None
+
+# Fonction pour calculer les coûts de chaque véhicule d'une flotte (montants en DZD), en
+# appliquant sur des colonnes entières les barèmes de calcul_droits_douane et calcul_TIC
+def calculer_flotte(flotte, vat_rate, frais_annexes):
+    carburants = indices_carburant(flotte)
+    essence = carburants == 0
+    diesel = carburants == 1
+    cylindrees = pd.to_numeric(flotte["cylindree"]).astype(float)
+    prix = pd.to_numeric(flotte["prix_dzd"]).astype(float)
+    taux_douane = np.select(
+        [essence & (cylindrees <= 1800), essence, diesel & (cylindrees <= 2000), diesel],
+        [15, 25, 20, 30],
+        0
+    )
+    taux_tic = np.select(
+        [diesel & (cylindrees > 3000), diesel & (cylindrees > 2500), diesel & (cylindrees > 2000)],
+        [10, 5, 2],
+        0
+    )
+    droits_douane = taux_douane / 100 * prix
+    tic = taux_tic / 100 * prix
+    montant_avant_tva = prix + droits_douane + tic + frais_annexes
+    tva = vat_rate / 100 * montant_avant_tva
+    total = montant_avant_tva + tva
+    prix_revente = pd.to_numeric(flotte["prix_revente_dzd"]).astype(float)
+    return pd.DataFrame({
+        "marque": flotte["marque"].astype(str),
+        "modele": flotte["modele"].astype(str),
+        "prix_dzd": prix,
+        "droits_douane": droits_douane,
+        "tic": tic,
+        "tva": tva,
+        "total": total,
+        "prix_revente_dzd": prix_revente,
+        "benefice": prix_revente - total,
+    })
+
+# Fonction pour calculer les coûts d'une flotte validée, mis en cache par contenu du fichier et paramètres
+@st.cache_data
+def couts_flotte(data, vat_rate, frais_annexes):
+    return calculer_flotte(lire_flotte(data), vat_rate, frais_annexes)
+
+# Fonction pour construire les colonnes de la synthèse d'une flotte dans la langue du catalogue
+def colonnes_synthese(t, couts_flotte):
+    montants = [
+        couts_flotte[column].sum()
+        for column in ("prix_dzd", "droits_douane", "tic", "tva", "total", "prix_revente_dzd", "benefice")
+    ]
+    return {
+        t["fleet_summary_columns"][0]: list(t["fleet_summary_labels"]),
+        t["fleet_summary_columns"][1]: [str(len(couts_flotte))] + [f"{montant:,.2f}" for montant in montants],
+    }
+
 # **Onglet 2 : Coûts & Taxes**
 with tabs[1]:
     st.header(texts["costs_header"])
@@ -444,50 +453,39 @@ with tabs[1]:
     total_dzd = montant_avant_TVA + TVA
     total_eur = total_dzd / conversion_rate if conversion_rate != 0 else 0
 
+    # Montants des coûts et taxes, dans l'ordre des lignes du tableau
+    costs_dzd = [price_ht_origin, droits_douane, TIC, frais_annexes, montant_avant_TVA, TVA, total_dzd]
+    costs_eur = [
+        price_ht_origin / conversion_rate,
+        droits_douane_eur,
+        TIC_eur,
+        frais_annexes_eur,
+        montant_avant_TVA / conversion_rate,
+        TVA_eur,
+        total_eur
+    ]
+
     # Présentation des coûts et taxes sous forme de tableau
-    costs_data = {
-        "Description": [
-            f"Prix HT sans TVA du pays d'origine",
-            f"Droits de Douane ({droits_douane_taux}%)",
-            f"TIC ({TIC_TAUX}%)",
-            "Frais Annexes",
-            "Montant Avant TVA",
-            f"TVA Algérienne ({TVA_TAUX}%)",
-            "Total Estimé"
-        ],
-        "En DZD": [
-            format_dzd(price_ht_origin),
-            format_dzd(droits_douane),
-            format_dzd(TIC),
-            format_dzd(frais_annexes),
-            format_dzd(montant_avant_TVA),
-            format_dzd(TVA),
-            format_dzd(total_dzd)
-        ],
-        "En EUR": [
-            f"{price_ht_origin / conversion_rate:,.2f}",
-            f"{droits_douane_eur:,.2f}",
-            f"{TIC_eur:,.2f}",
-            f"{frais_annexes_eur:,.2f}",
-            f"{montant_avant_TVA / conversion_rate:,.2f}",
-            f"{TVA_eur:,.2f}",
-            f"{total_eur:,.2f}"
-        ]
-    }
+    costs_data = colonnes_montants(
+        texts,
+        descriptions_couts(texts, droits_douane_taux, TIC_TAUX, TVA_TAUX),
+        costs_dzd,
+        costs_eur
+    )
 
     costs_df = pd.DataFrame(costs_data)
 
     # Affichage du tableau avec info-bulle sur la TVA
-    st.markdown("### **Détails des Coûts et Taxes**")
+    st.markdown(f"### **{texts['costs_details_header']}**")
     st.table(costs_df)
     st.markdown(
-        "<span title='La TVA est calculée sur le montant avant TVA, incluant le prix HT, les droits de douane, la TIC et les frais annexes.'>ℹ️</span> **Note :** La TVA est calculée sur la somme des éléments précédents.",
+        f"{info_bulle(texts['vat_note_help'], 'ℹ️')} {texts['vat_note']}",
         unsafe_allow_html=True
     )
 
 # **Onglet 3 : Revente & Bénéfice**
 with tabs[2]:
-    st.header("Calcul du Bénéfice de Revente" if language == "French" else "حساب الفائدة من إعادة البيع")
+    st.header(texts["resale_header"])
 
     # Aligner les champs côte à côte
     with st.container():
@@ -499,21 +497,17 @@ with tabs[2]:
                 key="resale_currency_select"
             )
         with col_resale_price:
-            if language == "French":
-                if resale_price_currency == "EUR":
-                    resale_price_eur = st.number_input("Prix de revente (en EUR)", min_value=0.0, value=1000.0, step=10.0, key="resale_eur")
-                    resale_price_dzd = resale_price_eur * conversion_rate
-                else:
-                    resale_price_dzd = st.number_input("Prix de revente (en DZD)", min_value=0.0, value=15000000.0, step=100000.0, key="resale_dzd")
-                    resale_price_eur = resale_price_dzd / conversion_rate if conversion_rate != 0 else 0
+            if resale_price_currency == "EUR":
+                resale_price_eur = st.number_input(texts["resale_eur_label"], min_value=0.0, value=1000.0, step=10.0, key="resale_eur")
+                resale_price_dzd = resale_price_eur * conversion_rate
             else:
-                # Version arabe...
-                pass
+                resale_price_dzd = st.number_input(texts["resale_dzd_label"], min_value=0.0, value=15000000.0, step=100000.0, key="resale_dzd")
+                resale_price_eur = resale_price_dzd / conversion_rate if conversion_rate != 0 else 0
 
     # Affichage des prix de revente avec traduction
-    st.markdown(f"**Prix de revente en DZD :** {format_dzd(resale_price_dzd)} / {resale_price_eur:,.2f} EUR")
+    st.markdown(texts["resale_price_display"].format(dzd=format_dzd(resale_price_dzd, texts), eur=resale_price_eur))
     st.markdown(
-        "<span title='En dialecte algérien, 15 000 000 DZD équivaut à 1 000 EUR.'>ℹ️</span> **Note :** 15 000 000 DZD équivaut à 1 000 EUR.",
+        f"{info_bulle(texts['conversion_note_help'], 'ℹ️')} {texts['conversion_note']}",
         unsafe_allow_html=True
     )
 
@@ -522,9 +516,9 @@ with tabs[2]:
     benefit_eur = benefit_dzd / parallel_rate if parallel_rate != 0 else 0
 
     if benefit_dzd >= 0:
-        st.success(f"{texts['benefit_label']}: {format_dzd(benefit_dzd)} / {benefit_eur:,.2f} EUR")
+        st.success(f"{texts['benefit_label']}: {format_dzd(benefit_dzd, texts)} / {benefit_eur:,.2f} EUR")
     else:
-        st.warning(f"{texts['benefit_label']}: {format_dzd(benefit_dzd)} / {benefit_eur:,.2f} EUR")
+        st.warning(f"{texts['benefit_label']}: {format_dzd(benefit_dzd, texts)} / {benefit_eur:,.2f} EUR")
 
     # **Nouvelle Fonctionnalité : Bénéfice Minimum Souhaité en DZD ou EUR**
     st.subheader(texts["desired_profit_label"])
@@ -563,55 +557,32 @@ with tabs[2]:
     minimum_resale_price_eur = minimum_resale_price_dzd / parallel_rate if parallel_rate != 0 else 0
 
     # Afficher le prix minimum de revente
-    st.markdown(f"**{texts['minimum_resale_price_label']} :** {format_dzd(minimum_resale_price_dzd)} / {minimum_resale_price_eur:,.2f} EUR")
+    st.markdown(texts["minimum_resale_price_display"].format(
+        dzd=format_dzd(minimum_resale_price_dzd, texts),
+        eur=minimum_resale_price_eur
+    ))
 
     # Avertir si le prix de revente est inférieur au minimum requis
     if resale_price_dzd < minimum_resale_price_dzd:
-        st.warning("Le prix de revente saisi est inférieur au prix minimum requis pour atteindre le bénéfice souhaité.")
+        st.warning(texts["resale_below_minimum"])
 
 # **Onglet 4 : Résumé & Rapport**
 with tabs[3]:
     st.subheader(texts["summary_header"])
 
     # Mettre à jour le tableau récapitulatif pour refléter les nouveaux calculs
-    summary_data = {
-        "Description": [
-            f"Prix HT sans TVA du pays d'origine",
-            f"Droits de Douane ({droits_douane_taux}%)",
-            f"TIC ({TIC_TAUX}%)",
-            "Frais Annexes",
-            f"Montant Avant TVA",
-            f"TVA Algérienne ({TVA_TAUX}%)",
-            "Total Estimé",
-            "Prix de Revente",
-            "Bénéfice Potentiel",
+    summary_dzd = costs_dzd + [resale_price_dzd, benefit_dzd, minimum_resale_price_dzd]
+    summary_eur = costs_eur + [resale_price_eur, benefit_eur, minimum_resale_price_eur]
+    summary_data = colonnes_montants(
+        texts,
+        descriptions_couts(texts, droits_douane_taux, TIC_TAUX, TVA_TAUX) + [
+            texts["row_resale_price"],
+            texts["row_benefit"],
             texts["minimum_resale_price_label"]
         ],
-        "En DZD": [
-            format_dzd(price_ht_origin),
-            format_dzd(droits_douane),
-            format_dzd(TIC),
-            format_dzd(frais_annexes),
-            format_dzd(montant_avant_TVA),
-            format_dzd(TVA),
-            format_dzd(total_dzd),
-            format_dzd(resale_price_dzd),
-            format_dzd(benefit_dzd),
-            format_dzd(minimum_resale_price_dzd)
-        ],
-        "En EUR": [
-            f"{price_ht_origin / conversion_rate:,.2f}",
-            f"{droits_douane_eur:,.2f}",
-            f"{TIC_eur:,.2f}",
-            f"{frais_annexes_eur:,.2f}",
-            f"{montant_avant_TVA / conversion_rate:,.2f}",
-            f"{TVA_eur:,.2f}",
-            f"{total_eur:,.2f}",
-            f"{resale_price_eur:,.2f}",
-            f"{benefit_eur:,.2f}",
-            f"{minimum_resale_price_eur:,.2f}"
-        ]
-    }
+        summary_dzd,
+        summary_eur
+    )
 
     summary_df = pd.DataFrame(summary_data)
 
@@ -626,78 +597,127 @@ with tabs[3]:
     st.header(texts["restrictions_header"])
     st.markdown(texts["restrictions_list"])
 
+    # Devis pour une flotte de véhicules importée depuis un fichier CSV
+    st.header(texts["fleet_header"])
+    fleet_file = st.file_uploader(texts["fleet_upload_label"], type="csv", help=texts["fleet_upload_help"])
+    fleet_costs = None
+    if fleet_file is not None:
+        try:
+            flotte = lire_flotte(fleet_file.getvalue())
+        except (pd.errors.EmptyDataError, pd.errors.ParserError, UnicodeDecodeError) as e:
+            st.error(texts["fleet_invalid_file"].format(error=e))
+        else:
+            missing_columns = [column for column in FLEET_COLUMNS if column not in flotte.columns]
+            invalid_value = None if missing_columns else premiere_valeur_invalide(flotte)
+            invalid_fuel = None if missing_columns else premier_carburant_invalide(flotte)
+            if missing_columns:
+                st.error(texts["fleet_missing_columns"].format(columns=", ".join(missing_columns)))
+            elif invalid_value is not None:
+                column, line, value = invalid_value
+                st.error(texts["fleet_invalid_value"].format(column=column, line=line, value=value))
+            elif invalid_fuel is not None:
+                line, value = invalid_fuel
+                st.error(texts["fleet_invalid_fuel"].format(
+                    line=line,
+                    value=value,
+                    accepted=", ".join(texts["fuel_options"])
+                ))
+            else:
+                fleet_costs = couts_flotte(fleet_file.getvalue(), vat_rate, frais_annexes)
+                st.dataframe(fleet_costs.set_axis(list(texts["fleet_columns"]), axis=1))
+                st.table(pd.DataFrame(colonnes_synthese(texts, fleet_costs)))
+
     # Téléchargement du Rapport d'Estimation
     st.header(texts["download_header"])
 
     if FPDF_AVAILABLE:
-        if st.button(texts["download_button"]):
-            try:
-                # Création du rapport
-                pdf = PDF()
-                pdf.add_page()
-
-                # Ajouter un chapitre pour les informations générales
-                pdf.chapter_title("Informations Générales")
-                general_info = f"""
-**Statut de l'Importateur :** {importer_status}
-
-**Taux de Conversion (DZD/EUR) :** {conversion_rate}
-
-**Marque :** {selected_make}
-
-**Modèle :** {selected_model_name}
-
-**Date de Fabrication :** {manufacture_year} - {manufacture_month_name}
-
-**Type de Carburant :** {carburant}
-
-**Cylindrée :** {cylindree} cm³
-
-**État de Conformité :** {etat}
-
-**Prix du Véhicule :** {format_dzd(price)} / {price_eur:,.2f} EUR
-"""
-                pdf.chapter_body(general_info)
-
-                # Ajouter un chapitre pour les coûts et taxes
-                pdf.chapter_title(texts["costs_header"])
-                costs_data_pdf = {
-                    "Description": summary_data["Description"][:7],
-                    "En DZD": summary_data["En DZD"][:7],
-                    "En EUR": summary_data["En EUR"][:7]
-                }
-                costs_df_pdf = pd.DataFrame(costs_data_pdf)
-                pdf.add_table(costs_df_pdf, "Coûts et Taxes")
-
-                # Ajouter un chapitre pour le bénéfice de revente
-                pdf.chapter_title("Calcul du Bénéfice de Revente")
-                benefit_info = f"""
-**Prix de Revente :** {format_dzd(resale_price_dzd)} / {resale_price_eur:,.2f} EUR
-
-**Bénéfice Potentiel :** {format_dzd(benefit_dzd)} / {benefit_eur:,.2f} EUR
-
-**{texts['minimum_resale_price_label']} :** {format_dzd(minimum_resale_price_dzd)} / {minimum_resale_price_eur:,.2f} EUR
-"""
-                pdf.chapter_body(benefit_info)
-
-                # Ajouter les documents requis et les restrictions
-                pdf.chapter_title(texts["document_header"])
-                pdf.chapter_body(texts["document_list"])
-
-                pdf.chapter_title(texts["restrictions_header"])
-                pdf.chapter_body(texts["restrictions_list"])
-
-                # Générer le PDF en mémoire
-                pdf_data = pdf.output(dest='S').encode('latin1')
-
-                # Bouton de téléchargement
-                st.download_button(
-                    label=texts["download_button"],
-                    data=pdf_data,
-                    file_name=texts["report_filename"],
-                    mime='application/pdf'
-                )
-            except Exception as e:
-                st.error(f"Erreur lors de la génération du PDF : {e}")
+        # Description figée du rapport : sa clé identifie un rendu réutilisable
+        general_info = pdf_texts["pdf_general_info_body"].format(
+            status=pdf_texts["status_options"][texts["status_options"].index(importer_status)],
+            conversion_rate=conversion_rate,
+            make=selected_make,
+            model=selected_model_name,
+            year=manufacture_year,
+            month=pdf_texts["months"][manufacture_month - 1],
+            fuel=pdf_texts["fuel_options"][texts["fuel_options"].index(carburant)],
+            cylindree=cylindree,
+            etat=pdf_texts["etat_options"][texts["etat_options"].index(etat)],
+            price_dzd=format_dzd(price, pdf_texts),
+            price_eur=price_eur
+        )
+        benefit_info = pdf_texts["pdf_benefit_body"].format(
+            resale_dzd=format_dzd(resale_price_dzd, pdf_texts),
+            resale_eur=resale_price_eur,
+            benefit_dzd=format_dzd(benefit_dzd, pdf_texts),
+            benefit_eur=benefit_eur,
+            minimum_dzd=format_dzd(minimum_resale_price_dzd, pdf_texts),
+            minimum_eur=minimum_resale_price_eur
+        )
+        costs_data_pdf = colonnes_montants(
+            pdf_texts,
+            descriptions_couts(pdf_texts, droits_douane_taux, TIC_TAUX, TVA_TAUX),
+            costs_dzd,
+            costs_eur
+        )
+        costs_columns = tuple((column, tuple(values)) for column, values in costs_data_pdf.items())
+        rapport = (pdf_texts["pdf_title"], (
+            ("title", pdf_texts["pdf_general_info"]),
+            ("body", general_info),
+            ("title", pdf_texts["costs_header"]),
+            ("table", pdf_texts["pdf_costs_table"], costs_columns),
+            ("title", pdf_texts["resale_header"]),
+            ("body", benefit_info),
+            ("title", pdf_texts["document_header"]),
+            ("body", pdf_texts["document_list"]),
+            ("title", pdf_texts["restrictions_header"]),
+            ("body", pdf_texts["restrictions_list"]),
+        ))
+
+        # Détail de la flotte et page de synthèse
+        if fleet_costs is not None:
+            fleet_columns = tuple(
+                (header, tuple(
+                    texte_pdf(value) if isinstance(value, str) else value
+                    for value in fleet_costs[column].tolist()
+                ))
+                for header, column in zip(pdf_texts["fleet_columns"], fleet_costs.columns)
+            )
+            summary_columns = tuple(
+                (header, tuple(values))
+                for header, values in colonnes_synthese(pdf_texts, fleet_costs).items()
+            )
+            rapport = (rapport[0], rapport[1] + (
+                ("page",),
+                ("table", pdf_texts["fleet_table_title"], fleet_columns, FLEET_TABLE_OPTIONS),
+                ("page",),
+                ("table", pdf_texts["fleet_summary_title"], summary_columns),
+            ))
+
+        # Lancer le rendu spéculatif dès que les saisies sont stables
+        report_worker = get_report_worker()
+        report_key = cle_rapport(rapport)
+        previous_key = st.session_state.get("report_key")
+        if previous_key is not None and previous_key != report_key:
+            report_worker.discard(previous_key)
+        st.session_state["report_key"] = report_key
+        report_job = report_worker.submit(report_key, rapport, delay=REPORT_DEBOUNCE_SECONDS)
+
+        # Afficher la progression sans bloquer l'exécution tant que le rendu n'est pas terminé
+        if not report_job.future.done():
+            afficher_progression_rapport(report_job)
+        elif report_job.abandoned():
+            # Rendu abandonné par une autre session aux saisies identiques : relancer la page
+            st.rerun()
+        elif report_job.failed():
+            # Le rendu en erreur est conservé : il n'est relancé que si le rapport change
+            st.error(texts["pdf_error"].format(error=report_job.future.exception()))
+        else:
+            # Bouton de téléchargement
+            st.download_button(
+                label=texts["download_button"],
+                data=report_job.future.result(),
+                file_name=texts["report_filename"],
+                mime='application/pdf'
+            )
     else:
-        st.warning("La génération de rapports PDF nécessite l'installation du module 'fpdf'. Veuillez l'installer pour utiliser cette fonctionnalité.")
+        st.warning(texts["fpdf_required"])
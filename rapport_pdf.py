@@ -0,0 +1,318 @@
+import hashlib
+import math
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Tentative d'importation de FPDF avec gestion des erreurs
+try:
+    from fpdf import FPDF
+    FPDF_AVAILABLE = True
+except ModuleNotFoundError:
+    FPDF_AVAILABLE = False
+
+# Paramètres de la génération des rapports en arrière-plan
+REPORT_WORKERS = 2  # Nombre de threads dédiés à la construction des PDF
+REPORT_CACHE_SIZE = 32  # Nombre de rapports terminés conservés en mémoire
+
+TRUNCATION_MARK = "..."  # Marque des textes raccourcis dans les colonnes de texte
+
+# Fonction pour formater une cellule de tableau
+def format_cellule(item):
+    if isinstance(item, float) or isinstance(item, int):
+        return f"{item:,.2f}"
+    return str(item)
+
+# Classe pour générer le PDF
+if FPDF_AVAILABLE:
+    class PDF(FPDF):
+        def __init__(self, report_title):
+            super().__init__()
+            self.report_title = report_title
+
+        # FPDF 1.7 ajoute chaque ligne du document à une seule chaîne, ce qui rend
+        # output() quadratique : les morceaux sont conservés dans une liste et
+        # assemblés une seule fois, la longueur étant suivie pour les offsets
+        @property
+        def buffer(self):
+            if len(self._chunks) > 1:
+                self._chunks[:] = ["".join(self._chunks)]
+            return self._chunks[0] if self._chunks else ""
+
+        @buffer.setter
+        def buffer(self, value):
+            self._chunks = [value]
+            self._buffer_length = len(value)
+
+        def _out(self, s):
+            if isinstance(s, bytes):
+                s = s.decode("latin1")
+            elif not isinstance(s, str):
+                s = str(s)
+            if self.state == 2:
+                self.pages[self.page] += s + "\n"
+            else:
+                self._chunks.append(s + "\n")
+                self._buffer_length += len(s) + 1
+
+        def _newobj(self):
+            self.n += 1
+            self.offsets[self.n] = self._buffer_length
+            self._out(str(self.n) + ' 0 obj')
+
+        def header(self):
+            # Titre
+            self.set_font('Arial', 'B', 16)
+            self.cell(0, 10, self.report_title, ln=True, align='C')
+            self.ln(10)
+
+        def chapter_title(self, label):
+            # Sous-titre
+            self.set_font('Arial', 'B', 12)
+            self.cell(0, 10, label, ln=True)
+            self.ln(5)
+
+        def chapter_body(self, body):
+            # Corps du texte
+            self.set_font('Arial', '', 12)
+            for line in body.split('\n'):
+                self.multi_cell(0, 10, line)
+                self.ln()
+
+        def add_table(self, columns, title, row_height=10, font_size=10, text_columns=(0,), progression=None):
+            # Tableau à partir de colonnes (en-tête, valeurs) : les largeurs des textes sont
+            # mesurées une seule fois, l'en-tête est répété à chaque page et les lignes
+            # d'une page sont écrites en un seul bloc dans le flux PDF
+            self.set_font('Arial', 'B', 12)
+            self.cell(0, 10, title, ln=True)
+            self.ln(2)
+
+            headers = [str(header) for header, _ in columns]
+            cells = [[format_cellule(item) for item in values] for _, values in columns]
+            row_count = len(cells[0]) if cells else 0
+            text_columns = {i for i in text_columns if i < len(headers)}
+
+            self.set_font('Arial', 'B', font_size)
+            header_widths = [self.get_string_width(header) for header in headers]
+            self.set_font('Arial', '', font_size)
+            cell_widths = [self._largeurs(column) for column in cells]
+
+            # Seules les colonnes de texte (marque, modèle, libellés...) peuvent être raccourcies :
+            # les montants gardent leur largeur naturelle, quitte à réduire la police
+            available = self.w - self.l_margin - self.r_margin
+            margins = 2 * self.c_margin * len(headers)
+            text = [max([header_widths[i]] + cell_widths[i]) for i in range(len(headers))]
+            minimum = [header_widths[i] if i in text_columns else text[i] for i in range(len(headers))]
+            if sum(minimum) + margins > available:
+                ratio = math.floor(font_size * (available - margins) / sum(minimum) * 10) / 10 / font_size
+                font_size *= ratio
+                header_widths = [width * ratio for width in header_widths]
+                cell_widths = [[width * ratio for width in widths] for widths in cell_widths]
+                text = [width * ratio for width in text]
+                minimum = [width * ratio for width in minimum]
+            natural = [width + 2 * self.c_margin for width in text]
+            if sum(natural) <= available:
+                # Tout tient : répartir la page proportionnellement au texte le plus long
+                col_widths = [width * available / sum(natural) for width in natural]
+            else:
+                # Partager la place restante entre les colonnes de texte, au-delà de leur en-tête
+                col_widths = list(natural)
+                spare = available - sum(natural[i] for i in range(len(headers)) if i not in text_columns)
+                spare -= sum(minimum[i] + 2 * self.c_margin for i in text_columns)
+                excess = sum(text[i] - minimum[i] for i in text_columns)
+                for i in text_columns:
+                    col_widths[i] = minimum[i] + 2 * self.c_margin + spare * (text[i] - minimum[i]) / excess
+
+            auto_page_break = self.auto_page_break
+            self.set_auto_page_break(False, self.b_margin)
+            row = 0
+            while True:
+                # Saut de page si l'en-tête et au moins une ligne ne tiennent plus
+                if self.y + 2 * row_height > self.page_break_trigger:
+                    self.add_page()
+                self.set_font('Arial', 'B', font_size)
+                self._out(self._ligne_tableau(headers, header_widths, col_widths, text_columns, row_height, self.y))
+                self.y += row_height
+                self.set_font('Arial', '', font_size)
+                rows_on_page = min(int((self.page_break_trigger - self.y) // row_height), row_count - row)
+                ops = [
+                    self._ligne_tableau(
+                        [column[r] for column in cells],
+                        [widths[r] for widths in cell_widths],
+                        col_widths,
+                        text_columns,
+                        row_height,
+                        self.y + (r - row) * row_height
+                    )
+                    for r in range(row, row + rows_on_page)
+                ]
+                if ops:
+                    self._out("\n".join(ops))
+                self.y += rows_on_page * row_height
+                row += rows_on_page
+                if progression is not None and row_count:
+                    progression(row / row_count)
+                if row >= row_count:
+                    break
+                self.add_page()
+            self.set_auto_page_break(auto_page_break, self.b_margin)
+            self.x = self.l_margin
+            self.ln(10)
+
+        def _largeurs(self, texts):
+            # Largeur de chaque texte dans la police courante, mesurée une fois par valeur distincte
+            known = {}
+            widths = []
+            for text in texts:
+                width = known.get(text)
+                if width is None:
+                    width = known[text] = self.get_string_width(text)
+                widths.append(width)
+            return widths
+
+        def _ligne_tableau(self, texts, text_widths, col_widths, text_columns, height, y):
+            # Opérateurs PDF d'une ligne de cellules encadrées (équivalent de cell(..., border=1))
+            k = self.k
+            x = self.l_margin
+            baseline = (self.h - (y + .5 * height + .3 * self.font_size)) * k
+            ops = []
+            for i, (text, text_width, width) in enumerate(zip(texts, text_widths, col_widths)):
+                ops.append('%.2f %.2f %.2f %.2f re S' % (x * k, (self.h - y) * k, width * k, -height * k))
+                if i in text_columns and text_width > width - 2 * self.c_margin:
+                    text = self._tronquer(text, width - 2 * self.c_margin)
+                if text:
+                    ops.append('BT %.2f %.2f Td (%s) Tj ET' % ((x + self.c_margin) * k, baseline, self._escape(text)))
+                x += width
+            return "\n".join(ops)
+
+        def _tronquer(self, text, max_width):
+            # Couper un texte trop long pour sa colonne en le signalant par des points de suspension
+            max_width -= self.get_string_width(TRUNCATION_MARK)
+            width = 0
+            for index, char in enumerate(text):
+                width += self.get_string_width(char)
+                if width > max_width:
+                    return text[:index] + TRUNCATION_MARK
+            return text
+
+# Fonction pour calculer la clé d'un rapport à partir de son contenu
+def cle_rapport(rapport):
+    return hashlib.sha1(repr(rapport).encode("utf-8")).hexdigest()
+
+# Fonction pour estimer le coût de rendu d'une section (les tableaux dominent)
+def poids_section(section):
+    if section[0] == "table":
+        return max(len(section[2][0][1]), 1) if section[2] else 1
+    return 1
+
+# Fonction pour construire le PDF à partir d'une description figée du rapport
+# (aucun appel à Streamlit : elle s'exécute dans un thread de travail)
+def construire_rapport_pdf(rapport, progression=None):
+    titre, sections = rapport
+    pdf = PDF(titre)
+    pdf.add_page()
+    total = sum(poids_section(section) for section in sections)
+    done = 0
+
+    def progression_section(poids):
+        if progression is None:
+            return None
+        return lambda fraction: progression((done + fraction * poids) / total)
+
+    for section in sections:
+        kind = section[0]
+        poids = poids_section(section)
+        if kind == "page":
+            pdf.add_page()
+        elif kind == "title":
+            pdf.chapter_title(section[1])
+        elif kind == "body":
+            pdf.chapter_body(section[1])
+        elif kind == "table":
+            options = section[3] if len(section) > 3 else {}
+            pdf.add_table(section[2], section[1], progression=progression_section(poids), **options)
+        done += poids
+        if progression is not None:
+            progression(done / total)
+    return pdf.output(dest='S').encode('latin1')
+
+# Tâche de génération d'un rapport suivie par le pool de travail
+class ReportJob:
+    def __init__(self):
+        self.future = Future()
+        self.progress = 0.0
+        self.started = False
+        self.timer = None
+
+    def set_progress(self, value):
+        self.progress = value
+
+    def abandoned(self):
+        # Une tâche abandonnée avant son rendu doit être relancée si le même contenu est redemandé
+        return self.future.cancelled()
+
+    def failed(self):
+        # Une tâche terminée en erreur est conservée : son erreur est affichée sans relancer le rendu
+        if not self.future.done() or self.future.cancelled():
+            return False
+        return self.future.exception() is not None
+
+# Pool de threads partagé qui construit les rapports et conserve les résultats
+class ReportWorker:
+    def __init__(self, max_workers=REPORT_WORKERS, cache_size=REPORT_CACHE_SIZE):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rapport-pdf")
+        self._lock = threading.Lock()
+        self._jobs = OrderedDict()
+        self._cache_size = cache_size
+
+    def submit(self, key, rapport, delay=0.0):
+        # Réutiliser la tâche existante (en attente, en cours, terminée ou en erreur) pour un contenu identique
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and not job.abandoned():
+                self._jobs.move_to_end(key)
+                return job
+            job = ReportJob()
+            self._jobs[key] = job
+            self._evict()
+        # Le délai de stabilisation s'écoule dans un minuteur : le rendu n'occupe un
+        # thread du pool que s'il n'a pas été abandonné entre-temps
+        if delay:
+            job.timer = threading.Timer(delay, self._start, args=(job, rapport))
+            job.timer.daemon = True
+            job.timer.start()
+        else:
+            self._start(job, rapport)
+        return job
+
+    def discard(self, key):
+        # Abandonner une tâche dont les saisies ont changé avant le début du rendu
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and not job.started:
+                if job.timer is not None:
+                    job.timer.cancel()
+                job.future.cancel()
+
+    def _start(self, job, rapport):
+        with self._lock:
+            if job.future.cancelled():
+                return
+            job.started = True
+        self._executor.submit(self._run, job, rapport)
+
+    def _run(self, job, rapport):
+        if not job.future.set_running_or_notify_cancel():
+            return
+        try:
+            job.future.set_result(construire_rapport_pdf(rapport, job.set_progress))
+        except Exception as e:
+            job.future.set_exception(e)
+
+    def _evict(self):
+        # Supprimer les tâches terminées les plus anciennes au-delà de la taille du cache
+        for key in list(self._jobs):
+            if len(self._jobs) <= self._cache_size:
+                break
+            if self._jobs[key].future.done():
+                del self._jobs[key]